@@ -6,12 +6,11 @@ import typer
 from dgi.cli_helpers import render_screen_table
 from dgi.config import get_config
 from dgi.filtering import DefaultFilter
-from dgi.models.company import CompanyData
 from dgi.portfolio import build
 from dgi.repositories.csv import CsvCompanyDataRepository
 from dgi.scoring import DefaultScoring
 from dgi.screener import Screener
-from dgi.validation import DgiRowValidator, PydanticRowValidation
+from dgi.validation import DEFAULT_COMPANY_VALIDATION, DgiRowValidator
 
 config = get_config()
 
@@ -44,6 +43,7 @@ def screen(
     csv_path: str | None = typer.Option(
         None, help="Path to CSV file (defaults to config)"
     ),
+    output: str = typer.Option("table", help="Output format: 'table' or 'json'"),
 ) -> None:
     """Screen companies using DGI criteria and display results in a rich table."""
     # Parameter validation
@@ -53,16 +53,20 @@ def screen(
             err=True,
         )
         raise typer.Exit(code=1)
-    try:
-        # Just check if rich is available by trying to import it
-        import rich  # noqa: F401
-    except ImportError as e:
-        typer.echo(
-            "[ERROR] The 'rich' package is required for table output. Please install it.",
-            err=True,
-        )
-        raise typer.Exit(code=1) from e
-    validator = DgiRowValidator(PydanticRowValidation(CompanyData))
+    if output not in ("table", "json"):
+        typer.echo("[ERROR] output must be 'table' or 'json'.", err=True)
+        raise typer.Exit(code=1)
+    if output == "table":
+        try:
+            # Just check if rich is available by trying to import it
+            import rich  # noqa: F401
+        except ImportError as e:
+            typer.echo(
+                "[ERROR] The 'rich' package is required for table output. Please install it.",
+                err=True,
+            )
+            raise typer.Exit(code=1) from e
+    validator = DgiRowValidator(DEFAULT_COMPANY_VALIDATION)
     data_path = csv_path or config.DATA_PATH  # Use provided path or default
 
     try:
@@ -82,7 +86,10 @@ def screen(
 
         # Sort by score descending
         result = scored.sort_values("score", ascending=False)
-        render_screen_table(result)
+        if output == "json":
+            typer.echo(json.dumps(result.to_dict(orient="records")))
+        else:
+            render_screen_table(result)
 
     except FileNotFoundError as e:
         typer.echo(
@@ -110,7 +117,7 @@ def build_portfolio(
         config.DEFAULT_MIN_CAGR, help="Minimum dividend CAGR"
     ),
 ) -> None:
-    validator = DgiRowValidator(PydanticRowValidation(CompanyData))
+    validator = DgiRowValidator(DEFAULT_COMPANY_VALIDATION)
     repo = CsvCompanyDataRepository(csv_path, validator)
     screener = Screener(
         repo, scoring_strategy=DefaultScoring(), filter_strategy=DefaultFilter()
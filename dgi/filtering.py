@@ -1,7 +1,26 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from pandas import DataFrame
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _dgi_mask(
+    df: DataFrame, min_yield: float, max_payout: float, min_cagr: float
+) -> "np.ndarray":
+    """Boolean mask for the base DGI criteria in one fused pass.
+
+    Comparing raw NumPy arrays skips the per-comparison index alignment
+    pandas Series operators pay for.
+    """
+    return (
+        (df["dividend_yield"].to_numpy() >= min_yield)
+        & (df["payout"].to_numpy() <= max_payout)
+        & (df["dividend_cagr"].to_numpy() >= min_cagr)
+    )
+
 
 class FilterStrategy(ABC):
     @abstractmethod
@@ -17,11 +36,7 @@ class DefaultFilter(FilterStrategy):
     def filter(
         self, df: DataFrame, min_yield: float, max_payout: float, min_cagr: float
     ) -> DataFrame:
-        return df[
-            (df["dividend_yield"] >= min_yield)
-            & (df["payout"] <= max_payout)
-            & (df["dividend_cagr"] >= min_cagr)
-        ]
+        return df[_dgi_mask(df, min_yield, max_payout, min_cagr)]
 
 
 class SectorFilter(FilterStrategy):
@@ -34,11 +49,7 @@ class SectorFilter(FilterStrategy):
         self, df: DataFrame, min_yield: float, max_payout: float, min_cagr: float
     ) -> DataFrame:
         # First apply base DGI filters
-        base_filtered = df[
-            (df["dividend_yield"] >= min_yield)
-            & (df["payout"] <= max_payout)
-            & (df["dividend_cagr"] >= min_cagr)
-        ]
+        base_filtered = df[_dgi_mask(df, min_yield, max_payout, min_cagr)]
 
         # Then apply sector filter if sector column exists
         if "sector" in base_filtered.columns:
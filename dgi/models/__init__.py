@@ -1,3 +1,3 @@
-from .company import CompanyData
+from .company import CANONICAL_COLUMNS, CompanyData
 
-__all__ = ["CompanyData"]
+__all__ = ["CANONICAL_COLUMNS", "CompanyData"]
@@ -2,6 +2,20 @@ from typing import Annotated, Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+# Canonical DataFrame column order for a screened universe, using the CSV
+# alias names (payout, dividend_cagr). Frozen so every consumer shares one
+# tuple instead of rebuilding the list per call.
+CANONICAL_COLUMNS = (
+    "symbol",
+    "name",
+    "sector",
+    "industry",
+    "dividend_yield",
+    "payout",
+    "dividend_cagr",
+    "fcf_yield",
+)
+
 
 class CompanyData(BaseModel):
     """Model for company financial data."""
@@ -1,6 +1,7 @@
 """Factory for creating LLM providers based on configuration."""
 
 import os
+from functools import lru_cache
 from typing import Any
 
 from .anthropic_provider import AnthropicProvider
@@ -118,12 +119,15 @@ def create_provider_from_env(
     return create_provider(provider_type=provider_str, model=model, **kwargs)
 
 
+@lru_cache(maxsize=1)
 def get_available_providers() -> dict[str, dict[str, Any]]:
     """Get information about all available providers.
 
     Returns:
         Dictionary with provider information including default models,
-        required environment variables, and capabilities.
+        required environment variables, and capabilities. The metadata is
+        static, so the dictionary is built once and cached; treat it as
+        read-only.
     """
     return {
         "openai": {
@@ -1,20 +1,49 @@
+import os
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Final, Literal, TextIO
+
 import pandas as pd
 
 from dgi.models import CompanyData
 from dgi.repositories.base import CompanyDataRepository
 from dgi.validation import DgiRowValidator
 
+# Use the multithreaded Arrow CSV parser when pyarrow is available; decide
+# once at import time so a failed attempt never half-consumes a text buffer.
+_CSV_ENGINE: Final[Literal["pyarrow", "c"]] = (
+    "pyarrow" if find_spec("pyarrow") is not None else "c"
+)
+
+
+@lru_cache(maxsize=32)
+def _parse_csv(
+    path: str, mtime: float, validator: DgiRowValidator
+) -> tuple[CompanyData, ...]:
+    """Parse and validate a CSV once per (path, mtime, validator).
+
+    Keying on the file's mtime means edits invalidate the entry
+    automatically; repeated loads of an unchanged file skip the whole
+    parse-and-validate pass.
+    """
+    df_raw = pd.read_csv(path, dtype=str, engine=_CSV_ENGINE)
+    return tuple(validator.validate_frame(df_raw))
+
 
 class CsvCompanyDataRepository(CompanyDataRepository):
-    def __init__(self, csv_path: str, validator: DgiRowValidator):
+    def __init__(self, csv_path: str | TextIO, validator: DgiRowValidator):
+        # Either a filesystem path or an open text buffer (e.g. io.StringIO);
+        # pandas accepts both, and a buffer avoids disk I/O entirely.
         self.csv_path = csv_path
         self.validator = validator
 
     def get_rows(self) -> list[CompanyData]:
-        df_raw = pd.read_csv(self.csv_path, dtype=str)
-        # Convert to list of dicts with string keys to satisfy type checker
-        records = df_raw.to_dict(orient="records")
-        string_key_records = [
-            {str(k): v for k, v in record.items()} for record in records
-        ]
-        return self.validator.validate_rows(string_key_records)
+        if isinstance(self.csv_path, str):
+            mtime = os.path.getmtime(self.csv_path)
+            return list(_parse_csv(self.csv_path, mtime, self.validator))
+        # Text buffers have no mtime to key on (and are consumed by the
+        # read), so they always parse directly.
+        df_raw = pd.read_csv(self.csv_path, dtype=str, engine=_CSV_ENGINE)
+        # Vectorized fast path: bulk numeric coercion plus model_construct,
+        # with per-row re-validation only for rows that fail the masks.
+        return self.validator.validate_frame(df_raw)
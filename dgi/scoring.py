@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+from pandas import DataFrame, Series
+
 from dgi.models import CompanyData
 
 
@@ -18,3 +21,16 @@ class DefaultScoring(ScoringStrategy):
         composite = composite / 3.0
         result = max(0.0, min(composite, 1.0))
         return float(result)
+
+    def score_frame(self, df: DataFrame) -> Series:
+        """Vectorized equivalent of :meth:`score` over a whole DataFrame.
+
+        Expects the DataFrame column names ('payout', 'dividend_cagr',
+        'fcf_yield') and computes every score in one NumPy pass instead of
+        a Python-level call per row.
+        """
+        cagr_norm = np.clip(df["dividend_cagr"].to_numpy(dtype=float) / 20.0, 0.0, 1.0)
+        fcf_norm = np.clip(df["fcf_yield"].to_numpy(dtype=float) / 20.0, 0.0, 1.0)
+        payout_norm = np.clip(df["payout"].to_numpy(dtype=float) / 100.0, 0.0, 1.0)
+        composite = (cagr_norm + fcf_norm - payout_norm) / 3.0
+        return Series(np.clip(composite, 0.0, 1.0), index=df.index, name="score")
@@ -3,15 +3,16 @@
 import logging
 from typing import Any, Protocol
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
 from dgi.filtering import DefaultFilter, FilterStrategy
-from dgi.models import CompanyData
+from dgi.models import CANONICAL_COLUMNS, CompanyData
 from dgi.repositories.base import CompanyDataRepository
 from dgi.repositories.csv import CsvCompanyDataRepository
 from dgi.scoring import ScoringStrategy
-from dgi.validation import DgiRowValidator, PydanticRowValidation
+from dgi.validation import DEFAULT_COMPANY_VALIDATION, DgiRowValidator
 
 logger = logging.getLogger(__name__)
 
@@ -48,47 +49,35 @@ class Screener:
         )  # Penalize high payout over 60%
         return float(yield_score + growth_score + payout_penalty)
 
+    @staticmethod
+    def default_score_batch(df: DataFrame) -> "np.ndarray":
+        """Vectorized :meth:`default_score` over a whole DataFrame.
+
+        Same yield + scaled-growth - payout-penalty formula, computed as
+        three array ops instead of a CompanyData build per row.
+        """
+        yield_score = df["dividend_yield"].to_numpy(dtype=float)
+        growth_score = df["dividend_cagr"].to_numpy(dtype=float) * 0.5
+        payout = df["payout"].to_numpy(dtype=float)
+        payout_penalty = np.maximum(payout - 60.0, 0.0) * -0.1
+        return yield_score + growth_score + payout_penalty
+
     @staticmethod
     def rows_to_dataframe(rows: list[CompanyData]) -> DataFrame:
-        # Convert to dict and then create mapping to use alias names
-        data_for_df = []
-        for row in rows:
-            row_dict = row.model_dump()
-            # Map back to alias names for DataFrame columns
-            mapped_dict = {
-                "symbol": row_dict["symbol"],
-                "name": row_dict["name"],
-                "sector": row_dict["sector"],
-                "industry": row_dict["industry"],
-                "dividend_yield": row_dict["dividend_yield"],
-                "payout": row_dict["payout_ratio"],  # Map back to alias
-                "dividend_cagr": row_dict["dividend_growth_5y"],  # Map back to alias
-                "fcf_yield": row_dict["fcf_yield"],
-            }
-            data_for_df.append(mapped_dict)
-
-        expected_columns = [
-            "symbol",
-            "name",
-            "sector",
-            "industry",
-            "dividend_yield",
-            "payout",
-            "dividend_cagr",
-            "fcf_yield",
-        ]
-        if not data_for_df:
+        if not rows:
             # Return empty DataFrame with expected columns
-            return pd.DataFrame(columns=expected_columns)
+            return pd.DataFrame(columns=CANONICAL_COLUMNS)
 
-        df = pd.DataFrame(data_for_df)
-        if any(col not in df.columns for col in expected_columns):
-            missing = [col for col in expected_columns if col not in df.columns]
+        # model_dump(by_alias=True) already emits the DataFrame column names
+        # (payout, dividend_cagr), so the frame builds in one allocation.
+        df = pd.DataFrame.from_records([row.model_dump(by_alias=True) for row in rows])
+        if any(col not in df.columns for col in CANONICAL_COLUMNS):
+            missing = [col for col in CANONICAL_COLUMNS if col not in df.columns]
             raise ValueError(
                 "Missing expected columns in validated data: "
                 f"{', '.join(missing)} or no valid rows found."
             )
-        df = df[expected_columns]
+        df = df[list(CANONICAL_COLUMNS)]
         return df
 
     def screen(
@@ -123,7 +112,9 @@ class Screener:
         if scored.empty:
             return scored
 
-        return scored.sort_values("score", ascending=False).head(top_n)
+        # Partial selection: nlargest avoids fully sorting the frame when
+        # only the top slice is returned.
+        return scored.nlargest(top_n, "score")
 
     def load_universe(self) -> DataFrame:
         """
@@ -158,32 +149,41 @@ class Screener:
 
     def add_scores(self, df: DataFrame) -> DataFrame:
         logger.info("Scoring DataFrame rows")
-        df = df.copy()
-
         # Handle empty DataFrame
         if df.empty:
-            df["score"] = []  # Add empty score column
-            return df
-
-        # Convert each row to CompanyData and score
-        def score_row(row: Any) -> float:
-            try:
-                company = CompanyData(**row.to_dict())
-                if self._scoring_strategy:
-                    score = self._scoring_strategy.score(company)
-                else:
-                    score = self.default_score(company)
-                return float(score)  # Ensure we return a scalar float
-            except Exception as e:
-                logger.error(f"Error scoring row: {e}")
-                return 0.0
-
-        df["score"] = df.apply(score_row, axis=1)
-        return df
+            return df.assign(score=[])  # Add empty score column
+
+        # Vectorized path: strategies exposing score_frame compute every
+        # score in one NumPy pass instead of a CompanyData build per row.
+        score_frame = getattr(self._scoring_strategy, "score_frame", None)
+        scoring_columns = {"dividend_yield", "dividend_cagr", "payout"}
+        if score_frame is not None:
+            scores = score_frame(df)
+        elif self._scoring_strategy is None and scoring_columns.issubset(df.columns):
+            scores = self.default_score_batch(df)
+        else:
+            # Convert each row to CompanyData and score
+            def score_row(row: Any) -> float:
+                try:
+                    company = CompanyData(**row.to_dict())
+                    if self._scoring_strategy:
+                        score = self._scoring_strategy.score(company)
+                    else:
+                        score = self.default_score(company)
+                    return float(score)  # Ensure we return a scalar float
+                except Exception as e:
+                    logger.error(f"Error scoring row: {e}")
+                    return 0.0
+
+            scores = df.apply(score_row, axis=1)
+
+        # assign attaches the column in one pass without the eager df.copy();
+        # copy-on-write shares the existing blocks with the result.
+        return df.assign(score=scores)
 
 
 # For backward compatibility, provide functional API using CSV repository
-_default_validator = DgiRowValidator(PydanticRowValidation(CompanyData))
+_default_validator = DgiRowValidator(DEFAULT_COMPANY_VALIDATION)
 _default_repo = CsvCompanyDataRepository(
     "data/fundamentals_small.csv", _default_validator
 )
@@ -1,7 +1,10 @@
 import logging
+from functools import cache
 from typing import TYPE_CHECKING, Any, Protocol
 
-from pydantic import ValidationError
+import numpy as np
+import pandas as pd
+from pydantic import TypeAdapter, ValidationError
 
 if TYPE_CHECKING:
     from dgi.models import CompanyData
@@ -14,10 +17,28 @@ else:
 from dgi.exceptions import DataValidationError
 
 # Export for external use
-__all__ = ["DataValidationError", "DgiRowValidator", "PydanticRowValidation"]
+__all__ = [
+    "DEFAULT_COMPANY_VALIDATION",
+    "DataValidationError",
+    "DgiRowValidator",
+    "PydanticRowValidation",
+]
 
 logger = logging.getLogger(__name__)
 
+# Column constraints mirrored from CompanyData for the vectorized fast path.
+# Rows passing these masks are safe to build with model_construct; rows that
+# fail are re-checked per row so error reporting stays authoritative.
+_NUMERIC_BOUNDS = {
+    "dividend_yield": (0.0, 100.0),
+    "payout": (0.0, 200.0),
+    "dividend_cagr": (-100.0, 100.0),
+    "fcf_yield": (-100.0, 100.0),
+}
+_STRING_COLUMNS = ("symbol", "name", "sector", "industry")
+# CSV alias -> CompanyData field name for model_construct keywords.
+_FIELD_NAMES = {"payout": "payout_ratio", "dividend_cagr": "dividend_growth_5y"}
+
 
 class RowValidationStrategy(Protocol):
     """Interface for row validation strategies."""
@@ -25,12 +46,42 @@ class RowValidationStrategy(Protocol):
     def validate(self, row: dict[str, Any]) -> "CompanyData": ...
 
 
+@cache
+def _adapter_for(model: type["CompanyData"]) -> TypeAdapter["CompanyData"]:
+    return TypeAdapter(model)
+
+
+@cache
+def _batch_adapter_for(model: type["CompanyData"]) -> TypeAdapter[list["CompanyData"]]:
+    # list[model] parametrizes with a runtime variable, which pydantic
+    # resolves happily but mypy cannot treat as a static type.
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
 class PydanticRowValidation:
     def __init__(self, model: type["CompanyData"]) -> None:
         self.model = model
+        # Memoized per model class, so every strategy built for the same
+        # model shares one compiled core schema instead of re-entering
+        # schema application.
+        self._adapter = _adapter_for(model)
+        self._batch_adapter = _batch_adapter_for(model)
 
     def validate(self, row: dict[str, Any]) -> "CompanyData":
-        return self.model.model_validate(row)
+        return self._adapter.validate_python(row)
+
+    def validate_many(self, rows: list[dict[str, Any]]) -> list["CompanyData"]:
+        """Validate a whole batch in one pydantic-core call.
+
+        Raises ValidationError if any row fails; callers fall back to
+        per-row validation to find out which ones.
+        """
+        return self._batch_adapter.validate_python(rows)
+
+
+# Shared strategy for the standard CompanyData schema; reusing it means the
+# TypeAdapter (and its compiled core schema) is built once per process.
+DEFAULT_COMPANY_VALIDATION = PydanticRowValidation(CompanyData)
 
 
 class DgiRowValidator:
@@ -43,20 +94,88 @@ class DgiRowValidator:
         self.required_columns = (
             None  # This attribute is no longer used in the new_code, but kept for now
         )
+        # Field names plus aliases the strategy's model understands; rows
+        # sharing no keys with this set are garbage and can fail without a
+        # pydantic schema walk. None when the strategy exposes no model.
+        self._known_fields: frozenset[str] | None = None
+        fields = getattr(getattr(strategy, "model", None), "model_fields", None)
+        if fields:
+            aliases = {f.alias for f in fields.values() if f.alias}
+            self._known_fields = frozenset(fields) | aliases
 
     def validate_rows(
         self, rows: list[dict[str, Any]]
     ) -> list["CompanyData"]:  # Fix type
-        valid_rows: list[CompanyData] = []
+        # Empty input can never produce valid rows; fail before touching
+        # pydantic at all.
+        if not rows:
+            raise DataValidationError("Validation errors:\nNo rows to validate")
+        str_rows = [{str(k): v for k, v in row.items()} for row in rows]
         errors: list[str] = []
-        for i, row in enumerate(rows):
-            row_str_keys = {str(k): v for k, v in row.items()}
-            if self.required_columns:
-                missing = [
-                    col for col in self.required_columns if col not in row_str_keys
-                ]
+        # Garbage screen: rows sharing no keys with the model's fields can
+        # fail on a frozenset intersection alone, so they never reach the
+        # batched call (where one bad row would fail the whole batch) or a
+        # per-row pydantic schema walk.
+        candidates = list(enumerate(str_rows))
+        if self._known_fields is not None:
+            candidates = []
+            for i, row_str_keys in enumerate(str_rows):
+                if row_str_keys.keys() & self._known_fields:
+                    candidates.append((i, row_str_keys))
+                else:
+                    error_msg = f"Row {i + 2}: no recognised fields"
+                    logger.error(error_msg)
+                    errors.append(error_msg)
+        if not candidates:
+            logger.error("Validation errors:\n%s", "\n".join(errors))
+            raise DataValidationError("Validation errors:\n" + "\n".join(errors))
+
+        # All-valid batches validate in a single pydantic-core call. On
+        # failure the error locations name the offending row indices, so the
+        # survivors revalidate with one more batched call - two pydantic-core
+        # crossings total, however many rows failed.
+        strategy = self._strategy
+        if isinstance(strategy, PydanticRowValidation) and not self.required_columns:
+            batch = [row for _, row in candidates]
+            try:
+                validated_batch = strategy.validate_many(batch)
+            except ValidationError as exc:
+                bad_rows: dict[int, list[str]] = {}
+                for err in exc.errors():
+                    if not err["loc"]:
+                        continue
+                    pos = candidates[int(err["loc"][0])][0]
+                    field = ".".join(str(part) for part in err["loc"][1:])
+                    bad_rows.setdefault(pos, []).append(f"{field}: {err['msg']}")
+                for pos in sorted(bad_rows):
+                    error_msg = f"Row {pos + 2}: {'; '.join(bad_rows[pos])}"
+                    logger.error(error_msg)
+                    errors.append(error_msg)
+                good = [row for i, row in candidates if i not in bad_rows]
+                if not good:
+                    logger.error("Validation errors:\n%s", "\n".join(errors))
+                    raise DataValidationError(
+                        "Validation errors:\n" + "\n".join(errors)
+                    ) from exc
+                logger.warning(
+                    "Some rows were invalid and skipped:\n%s", "\n".join(errors)
+                )
+                return strategy.validate_many(good)
+            if errors:
+                logger.warning(
+                    "Some rows were invalid and skipped:\n%s", "\n".join(errors)
+                )
+            return validated_batch
+
+        valid_rows: list[CompanyData] = []
+        # frozenset difference against the dict keys view runs in C; hoisted
+        # out of the loop so the set is built once.
+        required = frozenset(self.required_columns) if self.required_columns else None
+        for i, row_str_keys in candidates:
+            if required:
+                missing = required - row_str_keys.keys()
                 if missing:
-                    error_msg = f"Row {i + 2}: Missing: {', '.join(missing)}"
+                    error_msg = f"Row {i + 2}: Missing: {', '.join(sorted(missing))}"
                     logger.error(error_msg)
                     errors.append(error_msg)
                     continue
@@ -67,13 +186,74 @@ class DgiRowValidator:
                 error_msg = f"Row {i + 2}: {e}"
                 logger.error(error_msg)
                 errors.append(error_msg)
-            except Exception as e:
-                error_msg = f"Row {i + 2}: Unexpected error: {e}"
-                logger.error(error_msg)
-                errors.append(error_msg)
         if not valid_rows:
             logger.error("Validation errors:\n%s", "\n".join(errors))
             raise DataValidationError("Validation errors:\n" + "\n".join(errors))
         if errors:
             logger.warning("Some rows were invalid and skipped:\n%s", "\n".join(errors))
         return valid_rows
+
+    def validate_frame(self, df: pd.DataFrame) -> list["CompanyData"]:
+        """Validate a raw string-typed DataFrame with a vectorized fast path.
+
+        Numeric columns are coerced with ``pd.to_numeric`` and checked against
+        the model's bounds in bulk; rows passing every mask skip pydantic's
+        per-field machinery and are built with ``model_construct``. Rows that
+        fail any mask are re-validated individually through the configured
+        strategy, so skipped-row logging and the all-rows-invalid error keep
+        the exact per-row messages of :meth:`validate_rows`.
+        """
+        expected = list(_STRING_COLUMNS) + list(_NUMERIC_BOUNDS)
+        if any(col not in df.columns for col in expected):
+            # Schema mismatch: let the per-row path report the missing fields.
+            # Column labels are Hashable to pandas; stringify them so the
+            # records satisfy validate_rows' dict[str, Any] contract.
+            return self.validate_rows(
+                [
+                    {str(k): v for k, v in record.items()}
+                    for record in df.to_dict(orient="records")
+                ]
+            )
+
+        numeric = {
+            col: pd.to_numeric(df[col], errors="coerce").astype(float)
+            for col in _NUMERIC_BOUNDS
+        }
+        mask = pd.Series(True, index=df.index)
+        for col, (low, high) in _NUMERIC_BOUNDS.items():
+            mask &= numeric[col].between(low, high)  # NaN compares False
+        for col in _STRING_COLUMNS:
+            mask &= df[col].notna() & (df[col].astype(str).str.len() > 0)
+        mask &= df["symbol"].astype(str).str.len() <= 10
+
+        fast = df.loc[mask, list(_STRING_COLUMNS)].copy()
+        for col in numeric:
+            fast[col] = numeric[col][mask]
+        validated: dict[int, CompanyData] = {}
+        # flatnonzero yields ordinal row positions directly; Index.get_loc
+        # would type as int | slice | ndarray and cost a hash lookup per row.
+        positions: list[int] = np.flatnonzero(mask.to_numpy()).tolist()
+        for pos, row in zip(positions, fast.itertuples(index=False), strict=True):
+            validated[pos] = CompanyData.model_construct(
+                **{_FIELD_NAMES.get(col, col): getattr(row, col) for col in expected}
+            )
+
+        errors: list[str] = []
+        if not mask.all():
+            records = df.loc[~mask].to_dict(orient="records")
+            rejected: list[int] = np.flatnonzero(~mask.to_numpy()).tolist()
+            for pos, record in zip(rejected, records, strict=True):
+                row_str_keys = {str(k): v for k, v in record.items()}
+                try:
+                    validated[pos] = self._strategy.validate(row_str_keys)
+                except ValidationError as e:
+                    error_msg = f"Row {pos + 2}: {e}"
+                    logger.error(error_msg)
+                    errors.append(error_msg)
+
+        if not validated:
+            logger.error("Validation errors:\n%s", "\n".join(errors))
+            raise DataValidationError("Validation errors:\n" + "\n".join(errors))
+        if errors:
+            logger.warning("Some rows were invalid and skipped:\n%s", "\n".join(errors))
+        return [validated[pos] for pos in sorted(validated)]
@@ -0,0 +1,65 @@
+"""Shared fixtures for the test suite."""
+
+from pathlib import Path
+
+import pandas  # noqa: F401
+import pytest
+
+import dgi.cli
+import dgi.repositories.csv
+import dgi.scoring
+import dgi.screener  # noqa: F401
+from dgi.providers.anthropic_provider import AnthropicProvider
+from dgi.providers.base import LLMConfig, ProviderType
+from dgi.providers.openai_provider import OpenAIProvider
+from dgi.validation import DEFAULT_COMPANY_VALIDATION, DgiRowValidator
+
+# Kept as bytes so writing it skips the UTF-8 encode pass.
+STANDARD_CSV = (
+    b"symbol,name,sector,industry,dividend_yield,payout,dividend_cagr,fcf_yield\n"
+    b"AAPL,Apple,Tech,Hardware,2.0,40,5,4\n"
+    b"MSFT,Microsoft,Tech,Software,3.0,50,6,5\n"
+)
+
+
+@pytest.fixture(scope="session")
+def standard_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Well-formed two-row fundamentals CSV written once per session.
+
+    Tests that only read valid data share this file; tests that need a
+    malformed or schema-divergent CSV keep writing their own under
+    tmp_path.
+    """
+    csv = tmp_path_factory.mktemp("data") / "fundamentals.csv"
+    csv.write_bytes(STANDARD_CSV)
+    return csv
+
+
+@pytest.fixture(scope="session")
+def dgi_validator() -> DgiRowValidator:
+    """Row validator shared across tests.
+
+    DgiRowValidator holds no per-call state, so one instance (and one
+    pydantic schema build) serves the whole session.
+    """
+    return DgiRowValidator(DEFAULT_COMPANY_VALIDATION)
+
+
+@pytest.fixture(scope="session")
+def openai_provider() -> OpenAIProvider:
+    """OpenAI provider built once with the default test configuration."""
+    config = LLMConfig(
+        provider=ProviderType.OPENAI, model="gpt-4o-mini", api_key="test-key"
+    )
+    return OpenAIProvider(config)
+
+
+@pytest.fixture(scope="session")
+def anthropic_provider() -> AnthropicProvider:
+    """Anthropic provider built once with the default test configuration."""
+    config = LLMConfig(
+        provider=ProviderType.ANTHROPIC,
+        model="claude-3-5-sonnet-20241022",
+        api_key="test-key",
+    )
+    return AnthropicProvider(config)
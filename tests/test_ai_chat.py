@@ -2,7 +2,9 @@
 
 import pytest
 
+import ai_chat.chat_demo as chat_demo
 from ai_chat import screener_tool
+from dgi.screener import Screener
 
 
 def test_screen_dividends_basic():
@@ -33,8 +35,6 @@ def test_screen_dividends_filters():
 def test_screen_dividends_error(monkeypatch):
     """Test error handling in screen_dividends tool."""
     # Patch Screener.load_universe to raise
-    from dgi.screener import Screener
-
     monkeypatch.setattr(
         Screener, "load_universe", lambda self: (_ for _ in ()).throw(Exception("fail"))
     )
@@ -45,15 +45,12 @@ def test_screen_dividends_error(monkeypatch):
 
 def test_chat_demo_import_and_config(monkeypatch):
     """Test importing chat_demo and running show_provider_info."""
-    import ai_chat.chat_demo as chat_demo
-
     # Should not raise
     chat_demo.show_provider_info()
 
 
 def test_chat_demo_create_dgi_agent_handles_missing_key(monkeypatch):
     """Test create_dgi_agent handles missing API key gracefully."""
-    import ai_chat.chat_demo as chat_demo
 
     # Patch provider to simulate missing key
     class DummyProvider:
@@ -91,14 +88,10 @@ def test_chat_demo_create_dgi_agent_handles_missing_key(monkeypatch):
 
 
 def test_chat_demo_demo_queries():
-    import ai_chat.chat_demo as chat_demo
-
     queries = chat_demo.demo_queries()
     assert isinstance(queries, list)
     assert any("dividend" in q.lower() for q in queries)
 
 
 def test_chat_demo_show_provider_info_runs():
-    import ai_chat.chat_demo as chat_demo
-
     chat_demo.show_provider_info()
@@ -69,10 +69,10 @@ class TestDefaultFilter(unittest.TestCase):
 
         # Only row 2 should pass all filters
         self.assertEqual(len(result), 1)
-        self.assertEqual(result.iloc[0]["dividend_yield"], 3.0)
-        self.assertEqual(result.iloc[0]["payout"], 40.0)
-        self.assertEqual(result.iloc[0]["dividend_cagr"], 6.0)
-        self.assertEqual(result.iloc[0]["symbol"], "C")
+        self.assertEqual(result["dividend_yield"].iat[0], 3.0)
+        self.assertEqual(result["payout"].iat[0], 40.0)
+        self.assertEqual(result["dividend_cagr"].iat[0], 6.0)
+        self.assertEqual(result["symbol"].iat[0], "C")
 
     def test_default_filter_edge_values(self) -> None:
         """Test DefaultFilter with edge case values."""
@@ -1,13 +1,13 @@
 """Tests for LLM provider abstraction."""
 
-import os
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
 
 from dgi.providers import (
     AnthropicProvider,
     LLMConfig,
+    LLMProvider,
     OpenAIProvider,
     ProviderType,
     create_provider,
@@ -16,6 +16,27 @@ from dgi.providers import (
 )
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _mock_langchain():
+    """Stub out langchain client/agent construction for the whole module.
+
+    None of these tests exercise a real LLM, so there is no reason to pay
+    for SDK client construction (or risk it touching auth config).
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("dgi.providers.openai_provider.ChatOpenAI", MagicMock())
+        mp.setattr("dgi.providers.anthropic_provider.ChatAnthropic", MagicMock())
+        mp.setattr(
+            "dgi.providers.openai_provider.initialize_agent",
+            MagicMock(return_value=MagicMock()),
+        )
+        mp.setattr(
+            "dgi.providers.anthropic_provider.initialize_agent",
+            MagicMock(return_value=MagicMock()),
+        )
+        yield
+
+
 class TestLLMConfig:
     """Test LLM configuration class."""
 
@@ -86,23 +107,19 @@ class TestProviderFactory:
         provider = create_provider("anthropic", api_key="test")
         assert provider.config.model == "claude-3-5-sonnet-20241022"
 
-    @patch.dict(
-        os.environ,
-        {
-            "DGI_LLM_PROVIDER": "anthropic",
-            "DGI_LLM_MODEL": "claude-3-5-haiku-20241022",
-        },
-    )
-    def test_create_provider_from_env(self):
+    def test_create_provider_from_env(self, monkeypatch):
         """Test creating provider from environment variables."""
+        monkeypatch.setenv("DGI_LLM_PROVIDER", "anthropic")
+        monkeypatch.setenv("DGI_LLM_MODEL", "claude-3-5-haiku-20241022")
         provider = create_provider_from_env(api_key="test-key")
 
         assert isinstance(provider, AnthropicProvider)
         assert provider.config.model == "claude-3-5-haiku-20241022"
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_create_provider_from_env_defaults(self):
+    def test_create_provider_from_env_defaults(self, monkeypatch):
         """Test creating provider from env with defaults."""
+        monkeypatch.delenv("DGI_LLM_PROVIDER", raising=False)
+        monkeypatch.delenv("DGI_LLM_MODEL", raising=False)
         provider = create_provider_from_env(api_key="test-key")
 
         assert isinstance(provider, OpenAIProvider)
@@ -132,14 +149,11 @@ class TestProviderFactory:
 class TestOpenAIProvider:
     """Test OpenAI provider implementation."""
 
-    def test_provider_creation(self):
+    def test_provider_creation(self, openai_provider):
         """Test OpenAI provider creation."""
-        config = LLMConfig(
-            provider=ProviderType.OPENAI, model="gpt-4o-mini", api_key="test-key"
-        )
-        provider = OpenAIProvider(config)
-
-        assert provider.config == config
+        assert openai_provider.config.provider == ProviderType.OPENAI
+        assert openai_provider.config.model == "gpt-4o-mini"
+        assert openai_provider.config.api_key == "test-key"
 
     def test_invalid_provider_type(self):
         """Test creation with invalid provider type."""
@@ -151,16 +165,11 @@ class TestOpenAIProvider:
         with pytest.raises(ValueError, match="Invalid provider type"):
             OpenAIProvider(config)
 
-    def test_validate_api_key(self):
+    def test_validate_api_key(self, openai_provider):
         """Test API key validation."""
-        config = LLMConfig(
-            provider=ProviderType.OPENAI, model="gpt-4o-mini", api_key="test-key"
-        )
-        provider = OpenAIProvider(config)
+        assert openai_provider.validate_api_key() is True
 
-        assert provider.validate_api_key() is True
-
-    def test_validate_api_key_missing(self):
+    def test_validate_api_key_missing(self, monkeypatch):
         """Test API key validation when missing."""
         config = LLMConfig(
             provider=ProviderType.OPENAI,
@@ -168,12 +177,12 @@ class TestOpenAIProvider:
         )
         provider = OpenAIProvider(config)
 
-        with patch.dict(os.environ, {}, clear=True):
-            assert provider.validate_api_key() is False
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        assert provider.validate_api_key() is False
 
-    @patch.dict(os.environ, {"OPENAI_API_KEY": "env-key"})
-    def test_validate_api_key_from_env(self):
+    def test_validate_api_key_from_env(self, monkeypatch):
         """Test API key validation from environment."""
+        monkeypatch.setenv("OPENAI_API_KEY", "env-key")
         config = LLMConfig(
             provider=ProviderType.OPENAI,
             model="gpt-4o-mini",
@@ -182,14 +191,9 @@ class TestOpenAIProvider:
 
         assert provider.validate_api_key() is True
 
-    def test_get_model_info(self):
+    def test_get_model_info(self, openai_provider):
         """Test getting model information."""
-        config = LLMConfig(
-            provider=ProviderType.OPENAI, model="gpt-4o-mini", api_key="test-key"
-        )
-        provider = OpenAIProvider(config)
-
-        info = provider.get_model_info()
+        info = openai_provider.get_model_info()
 
         assert info["provider"] == "OpenAI"
         assert info["model"] == "gpt-4o-mini"
@@ -216,9 +220,6 @@ class TestOpenAIProvider:
 
     def test_openai_provider_error_on_missing_api_key(self, monkeypatch):
         """Test OpenAIProvider raises ValueError if API key is missing."""
-        from dgi.providers.base import LLMConfig, ProviderType
-        from dgi.providers.openai_provider import OpenAIProvider
-
         config = LLMConfig(provider=ProviderType.OPENAI, model="gpt-4o-mini")
         monkeypatch.delenv("OPENAI_API_KEY", raising=False)
         provider = OpenAIProvider(config)
@@ -228,9 +229,6 @@ class TestOpenAIProvider:
 
     def test_openai_provider_extra_params(self):
         """Test OpenAIProvider passes extra_params to client."""
-        from dgi.providers.base import LLMConfig, ProviderType
-        from dgi.providers.openai_provider import OpenAIProvider
-
         config = LLMConfig(
             provider=ProviderType.OPENAI,
             model="gpt-4o-mini",
@@ -243,9 +241,6 @@ class TestOpenAIProvider:
 
     def test_openai_provider_agent_kwargs(self):
         """Test OpenAIProvider.create_agent accepts extra kwargs."""
-        from dgi.providers.base import LLMConfig, ProviderType
-        from dgi.providers.openai_provider import OpenAIProvider
-
         config = LLMConfig(
             provider=ProviderType.OPENAI, model="gpt-4o-mini", api_key="test"
         )
@@ -253,51 +248,33 @@ class TestOpenAIProvider:
         agent = provider.create_agent([], verbose=False, max_iterations=1)
         assert agent is not None
 
-    def test_openai_provider_context_and_pricing_tiers(self):
-        from dgi.providers.base import LLMConfig, ProviderType
-        from dgi.providers.openai_provider import OpenAIProvider
-
-        config = LLMConfig(
-            provider=ProviderType.OPENAI, model="gpt-4-turbo", api_key="test"
-        )
+    @pytest.mark.parametrize(
+        "model,context_window,pricing_tier",
+        [
+            ("gpt-4-turbo", 128000, "premium"),
+            ("gpt-3.5-turbo", 16385, "standard"),
+            ("gpt-4o-mini", 128000, "low-cost"),
+            ("gpt-unknown", 4096, "premium"),
+        ],
+        ids=["gpt-4-turbo", "gpt-3.5-turbo", "gpt-4o-mini", "unknown"],
+    )
+    def test_openai_provider_context_and_pricing_tiers(
+        self, model, context_window, pricing_tier
+    ):
+        config = LLMConfig(provider=ProviderType.OPENAI, model=model, api_key="test")
         provider = OpenAIProvider(config)
-        assert provider._get_context_window() == 128000
-        config2 = LLMConfig(
-            provider=ProviderType.OPENAI, model="gpt-3.5-turbo", api_key="test"
-        )
-        provider2 = OpenAIProvider(config2)
-        assert provider2._get_context_window() == 16385
-        config3 = LLMConfig(
-            provider=ProviderType.OPENAI, model="gpt-unknown", api_key="test"
-        )
-        provider3 = OpenAIProvider(config3)
-        assert provider3._get_context_window() == 4096
-        assert provider._get_pricing_tier() == "premium"
-        config4 = LLMConfig(
-            provider=ProviderType.OPENAI, model="gpt-4o-mini", api_key="test"
-        )
-        provider4 = OpenAIProvider(config4)
-        assert provider4._get_pricing_tier() == "low-cost"
-        config5 = LLMConfig(
-            provider=ProviderType.OPENAI, model="gpt-3.5-turbo", api_key="test"
-        )
-        provider5 = OpenAIProvider(config5)
-        assert provider5._get_pricing_tier() == "standard"
+        assert provider._get_context_window() == context_window
+        assert provider._get_pricing_tier() == pricing_tier
 
 
 class TestAnthropicProvider:
     """Test Anthropic provider implementation."""
 
-    def test_provider_creation(self):
+    def test_provider_creation(self, anthropic_provider):
         """Test Anthropic provider creation."""
-        config = LLMConfig(
-            provider=ProviderType.ANTHROPIC,
-            model="claude-3-5-sonnet-20241022",
-            api_key="test-key",
-        )
-        provider = AnthropicProvider(config)
-
-        assert provider.config == config
+        assert anthropic_provider.config.provider == ProviderType.ANTHROPIC
+        assert anthropic_provider.config.model == "claude-3-5-sonnet-20241022"
+        assert anthropic_provider.config.api_key == "test-key"
 
     def test_invalid_provider_type(self):
         """Test creation with invalid provider type."""
@@ -309,20 +286,13 @@ class TestAnthropicProvider:
         with pytest.raises(ValueError, match="Invalid provider type"):
             AnthropicProvider(config)
 
-    def test_validate_api_key(self):
+    def test_validate_api_key(self, anthropic_provider):
         """Test API key validation."""
-        config = LLMConfig(
-            provider=ProviderType.ANTHROPIC,
-            model="claude-3-5-sonnet-20241022",
-            api_key="test-key",
-        )
-        provider = AnthropicProvider(config)
+        assert anthropic_provider.validate_api_key() is True
 
-        assert provider.validate_api_key() is True
-
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "env-key"})
-    def test_validate_api_key_from_env(self):
+    def test_validate_api_key_from_env(self, monkeypatch):
         """Test API key validation from environment."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "env-key")
         config = LLMConfig(
             provider=ProviderType.ANTHROPIC,
             model="claude-3-5-sonnet-20241022",
@@ -350,9 +320,6 @@ class TestAnthropicProvider:
 
     def test_anthropic_provider_error_on_missing_api_key(self, monkeypatch):
         """Test AnthropicProvider raises ValueError if API key is missing."""
-        from dgi.providers.anthropic_provider import AnthropicProvider
-        from dgi.providers.base import LLMConfig, ProviderType
-
         config = LLMConfig(
             provider=ProviderType.ANTHROPIC, model="claude-3-5-haiku-20241022"
         )
@@ -363,9 +330,6 @@ class TestAnthropicProvider:
 
     def test_anthropic_provider_extra_params(self):
         """Test AnthropicProvider passes extra_params to client."""
-        from dgi.providers.anthropic_provider import AnthropicProvider
-        from dgi.providers.base import LLMConfig, ProviderType
-
         config = LLMConfig(
             provider=ProviderType.ANTHROPIC,
             model="claude-3-5-haiku-20241022",
@@ -377,9 +341,6 @@ class TestAnthropicProvider:
 
     def test_anthropic_provider_agent_kwargs(self):
         """Test AnthropicProvider.create_agent accepts extra kwargs."""
-        from dgi.providers.anthropic_provider import AnthropicProvider
-        from dgi.providers.base import LLMConfig, ProviderType
-
         config = LLMConfig(
             provider=ProviderType.ANTHROPIC,
             model="claude-3-5-haiku-20241022",
@@ -389,99 +350,58 @@ class TestAnthropicProvider:
         agent = provider.create_agent([], verbose=False, max_iterations=1)
         assert agent is not None
 
-    def test_anthropic_provider_context_and_pricing_tiers(self):
-        from dgi.providers.anthropic_provider import AnthropicProvider
-        from dgi.providers.base import LLMConfig, ProviderType
-
-        config = LLMConfig(
-            provider=ProviderType.ANTHROPIC,
-            model="claude-3-5-haiku-20241022",
-            api_key="test",
-        )
+    @pytest.mark.parametrize(
+        "model,context_window,pricing_tier",
+        [
+            ("claude-3-5-haiku-20241022", 200000, "low-cost"),
+            ("claude-2.0", 100000, "standard"),
+            ("claude-3-opus-20240229", 200000, "premium"),
+            ("claude-3-5-sonnet-20241022", 200000, "standard"),
+            ("claude-unknown", 200000, "standard"),
+        ],
+        ids=["haiku", "claude-2.0", "opus", "sonnet", "unknown"],
+    )
+    def test_anthropic_provider_context_and_pricing_tiers(
+        self, model, context_window, pricing_tier
+    ):
+        config = LLMConfig(provider=ProviderType.ANTHROPIC, model=model, api_key="test")
         provider = AnthropicProvider(config)
-        assert provider._get_context_window() == 200000
-        config2 = LLMConfig(
-            provider=ProviderType.ANTHROPIC, model="claude-2.0", api_key="test"
-        )
-        provider2 = AnthropicProvider(config2)
-        assert provider2._get_context_window() == 100000
-        assert provider._get_pricing_tier() == "low-cost"
-        config3 = LLMConfig(
-            provider=ProviderType.ANTHROPIC,
-            model="claude-3-opus-20240229",
-            api_key="test",
-        )
-        provider3 = AnthropicProvider(config3)
-        assert provider3._get_pricing_tier() == "premium"
-        config4 = LLMConfig(
-            provider=ProviderType.ANTHROPIC,
-            model="claude-3-5-sonnet-20241022",
-            api_key="test",
-        )
-        provider4 = AnthropicProvider(config4)
-        assert provider4._get_pricing_tier() == "standard"
-        config5 = LLMConfig(
-            provider=ProviderType.ANTHROPIC, model="claude-unknown", api_key="test"
-        )
-        provider5 = AnthropicProvider(config5)
-        assert provider5._get_pricing_tier() == "standard"
+        assert provider._get_context_window() == context_window
+        assert provider._get_pricing_tier() == pricing_tier
 
 
-class TestProviderBase:
-    def test_llmprovider_abstract_methods(self):
-        from dgi.providers.base import LLMConfig, LLMProvider, ProviderType
+class DummyProvider(LLMProvider):
+    """Minimal concrete LLMProvider for exercising the base class."""
 
-        class DummyProvider(LLMProvider):
-            def _initialize_client(self):
-                return "client"
+    def _initialize_client(self):
+        return "client"
 
-            def create_agent(self, tools, **kwargs):
-                return "agent"
+    def create_agent(self, tools, **kwargs):
+        return "agent"
 
-            def validate_api_key(self):
-                return True
-
-            def get_model_info(self):
-                return {"foo": "bar"}
-
-        config = LLMConfig(
-            provider=ProviderType.OPENAI, model="gpt-4o-mini", api_key="test"
-        )
-        dummy = DummyProvider(config)
-        assert dummy.client == "client"
-        assert dummy.create_agent([]) == "agent"
-        assert dummy.validate_api_key() is True
-        assert dummy.get_model_info()["foo"] == "bar"
-        assert isinstance(dummy.get_config_summary(), dict)
+    def validate_api_key(self):
+        return True
 
-    def test_llmprovider_config_summary_keys(self):
-        from dgi.providers.base import LLMConfig, LLMProvider, ProviderType
+    def get_model_info(self):
+        return {"foo": "bar"}
 
-        class DummyProvider(LLMProvider):
-            def _initialize_client(self):
-                return "client"
 
-            def create_agent(self, tools, **kwargs):
-                return "agent"
-
-            def validate_api_key(self):
-                return True
+@pytest.fixture(scope="module")
+def dummy_provider():
+    config = LLMConfig(
+        provider=ProviderType.OPENAI, model="gpt-4o-mini", api_key="test"
+    )
+    return DummyProvider(config)
 
-            def get_model_info(self):
-                return {"foo": "bar"}
 
-        config = LLMConfig(
-            provider=ProviderType.OPENAI, model="gpt-4o-mini", api_key="test"
-        )
-        dummy = DummyProvider(config)
-        summary = dummy.get_config_summary()
+class TestProviderBase:
+    def test_llmprovider_abstract_methods(self, dummy_provider):
+        assert dummy_provider.client == "client"
+        assert dummy_provider.create_agent([]) == "agent"
+        assert dummy_provider.validate_api_key() is True
+        assert dummy_provider.get_model_info()["foo"] == "bar"
+        assert isinstance(dummy_provider.get_config_summary(), dict)
+
+    def test_llmprovider_config_summary_keys(self, dummy_provider):
+        summary = dummy_provider.get_config_summary()
         assert "provider" in summary and "model" in summary
-
-
-def test_factory_unsupported_provider():
-    import pytest
-
-    from dgi.providers.factory import create_provider
-
-    with pytest.raises(ValueError, match="Unsupported provider"):
-        create_provider("notarealprovider")
@@ -1,64 +1,60 @@
-import subprocess
-import sys
-from typing import Any
+import json
+from pathlib import Path
 
+import pytest
+from pandas import DataFrame
+from typer.testing import CliRunner
+
+from dgi.cli import app
 from dgi.models import CompanyData
 from dgi.portfolio import build, summary_stats
 from dgi.repositories.csv import CsvCompanyDataRepository
 from dgi.screener import Screener
 from dgi.validation import DgiRowValidator, PydanticRowValidation
 
+runner = CliRunner()
 
-def test_cli_help_runs() -> None:
-    result = subprocess.run(
-        [sys.executable, "-m", "dgi.cli", "--help"], capture_output=True, text=True
-    )
-    assert result.returncode == 0
-    assert "Usage" in result.stdout or "usage" in result.stdout
 
-
-def test_integration_csv_to_portfolio(tmp_path: Any) -> None:
-    csv = tmp_path / "integration.csv"
-    csv.write_text(
-        "symbol,name,sector,industry,dividend_yield,payout,dividend_cagr,fcf_yield\n"
-        "AAPL,Apple,Tech,Hardware,2.0,40,5,4\n"
-        "MSFT,Microsoft,Tech,Software,3.0,50,6,5\n"
-        "GOOG,Google,Tech,Software,4.0,60,7,6\n"
-    )
+@pytest.fixture(scope="session")
+def scored_df(standard_csv: Path) -> DataFrame:
+    """Filtered and scored universe built once from the shared CSV."""
     validator = DgiRowValidator(PydanticRowValidation(CompanyData))
-    repo = CsvCompanyDataRepository(str(csv), validator)
+    repo = CsvCompanyDataRepository(str(standard_csv), validator)
     screener = Screener(repo)
     df = screener.load_universe()
     filtered = screener.apply_filters(df, min_yield=2.0, max_payout=60, min_cagr=5.0)
-    scored = screener.add_scores(filtered)
-    port = build(scored, top_n=2, weighting="score")
+    return screener.add_scores(filtered)
+
+
+def test_cli_help_runs() -> None:
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "Usage" in result.output or "usage" in result.output
+
+
+@pytest.mark.integration
+def test_integration_csv_to_portfolio(scored_df: DataFrame) -> None:
+    scored = scored_df
+    port = build(scored, top_n=1, weighting="score")
     # Merge to get all columns for stats
     merged = port.merge(scored, left_on="ticker", right_on="symbol", how="left")
     stats = summary_stats(merged)
-    assert port.shape[0] == 2
+    assert port.shape[0] == 1
     assert "ticker" in port.columns
     assert stats["yield"] > 0
     assert stats["median_cagr"] > 0
     assert stats["mean_payout"] > 0
 
 
-def test_cli_screen_and_build_portfolio(tmp_path: Any) -> None:
-    csv = tmp_path / "cli_integration.csv"
-    csv.write_text(
-        "symbol,name,sector,industry,dividend_yield,payout,dividend_cagr,fcf_yield\n"
-        "AAPL,Apple,Tech,Hardware,2.0,40,5,4\n"
-        "MSFT,Microsoft,Tech,Software,3.0,50,6,5\n"
-        "GOOG,Google,Tech,Software,4.0,60,7,6\n"
-    )
+@pytest.mark.integration
+def test_cli_screen_and_build_portfolio(standard_csv: Path) -> None:
     # Test screen command
-    result = subprocess.run(
+    result = runner.invoke(
+        app,
         [
-            sys.executable,
-            "-m",
-            "dgi.cli",
             "screen",
             "--csv-path",
-            str(csv),
+            str(standard_csv),
             "--min-yield",
             "2.0",
             "--max-payout",
@@ -66,20 +62,16 @@ def test_cli_screen_and_build_portfolio(tmp_path: Any) -> None:
             "--min-cagr",
             "5.0",
         ],
-        capture_output=True,
-        text=True,
     )
-    assert result.returncode == 0
-    assert "AAPL" in result.stdout or "MSFT" in result.stdout or "GOOG" in result.stdout
+    assert result.exit_code == 0
+    assert "AAPL" in result.output or "MSFT" in result.output or "GOOG" in result.output
     # Test build_portfolio command
-    result = subprocess.run(
+    result = runner.invoke(
+        app,
         [
-            sys.executable,
-            "-m",
-            "dgi.cli",
             "build-portfolio",
             "--csv-path",
-            str(csv),
+            str(standard_csv),
             "--top-n",
             "2",
             "--weighting",
@@ -91,65 +83,36 @@ def test_cli_screen_and_build_portfolio(tmp_path: Any) -> None:
             "--min-cagr",
             "5.0",
         ],
-        capture_output=True,
-        text=True,
     )
-    assert result.returncode == 0
-    assert "ticker" in result.stdout
+    assert result.exit_code == 0
+    assert "ticker" in result.output
 
 
-def test_cli_screen_rich_table_output(tmp_path: Any) -> None:
-    csv = tmp_path / "rich_table.csv"
-    csv.write_text(
-        "symbol,name,sector,industry,dividend_yield,payout,dividend_cagr,fcf_yield\n"
-        "AAPL,Apple,Tech,Hardware,2.0,40,5,4\n"
-        "MSFT,Microsoft,Tech,Software,3.0,50,6,5\n"
-    )
-    result = subprocess.run(
+def test_cli_screen_json_output(standard_csv: Path) -> None:
+    result = runner.invoke(
+        app,
         [
-            sys.executable,
-            "-m",
-            "dgi.cli",
             "screen",
             "--csv-path",
-            str(csv),
+            str(standard_csv),
             "--min-yield",
             "2.0",
+            "--output",
+            "json",
         ],
-        capture_output=True,
-        text=True,
     )
-    assert result.returncode == 0
-    # Check for Rich table headers and at least one row
-    assert "DGI Screen Results" in result.stdout
-    assert "Symbol" in result.stdout
-    assert "AAPL" in result.stdout or "MSFT" in result.stdout
+    assert result.exit_code == 0
+    # Structured output: assert on parsed records, not rendered table text
+    data = json.loads(result.output)
+    assert {row["symbol"] for row in data} == {"AAPL", "MSFT"}
+    assert all("score" in row for row in data)
 
 
-def test_cli_screen_bad_param(tmp_path: Any) -> None:
-    csv = tmp_path / "bad_param.csv"
-    csv.write_text(
-        "symbol,name,sector,industry,dividend_yield,payout,dividend_cagr,fcf_yield\n"
-        "AAPL,Apple,Tech,Hardware,2.0,40,5,4\n"
-    )
-    # Use an invalid parameter (e.g., negative min-yield)
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "dgi.cli",
-            "screen",
-            "--csv-path",
-            str(csv),
-            "--min-yield",
-            "-1.0",
-        ],
-        capture_output=True,
-        text=True,
+def test_cli_screen_bad_param(standard_csv: Path) -> None:
+    # Use an invalid parameter (e.g., negative min-yield); the CLI rejects
+    # it before the CSV is read, so the shared fixture file suffices.
+    result = runner.invoke(
+        app, ["screen", "--csv-path", str(standard_csv), "--min-yield", "-1.0"]
     )
     # Should exit with code 1 and print an error
-    assert (
-        result.returncode == 1
-        or "[ERROR]" in result.stdout
-        or "[ERROR]" in result.stderr
-    )
+    assert result.exit_code == 1
@@ -9,25 +9,43 @@ from dgi.scoring import DefaultScoring
 class TestDefaultScoring(unittest.TestCase):
     """Tests for DefaultScoring implementation."""
 
-    def test_default_scoring_basic(self) -> None:
-        """Test basic scoring functionality."""
+    def test_default_scoring(self) -> None:
+        """Score stays a float in [0, 1] across representative inputs."""
         scoring = DefaultScoring()
 
-        test_company = CompanyData(
-            symbol="TEST",
-            name="Test Company",  # Use 'name' not 'company_name'
-            sector="Technology",
-            industry="Software",
-            dividend_yield=3.0,
-            payout_ratio=40.0,  # Use 'payout_ratio' not 'payout'
-            dividend_growth_5y=8.0,  # Use 'dividend_growth_5y' not 'dividend_cagr'
-            fcf_yield=5.0,
-        )
-
-        score = scoring.score(test_company)
-        self.assertIsInstance(score, float)
-        self.assertGreaterEqual(score, 0.0)
-        self.assertLessEqual(score, 1.0)
+        cases = {
+            "basic": {
+                "dividend_yield": 3.0,
+                "payout_ratio": 40.0,
+                "dividend_growth_5y": 8.0,
+                "fcf_yield": 5.0,
+            },
+            "zero": {
+                "dividend_yield": 0.0,
+                "payout_ratio": 0.0,
+                "dividend_growth_5y": 0.0,
+                "fcf_yield": 0.0,
+            },
+            "extreme": {
+                "dividend_yield": 12.0,
+                "payout_ratio": 200.0,
+                "dividend_growth_5y": 100.0,
+                "fcf_yield": 100.0,
+            },
+        }
+        for case, fields in cases.items():
+            with self.subTest(case=case):
+                test_company = CompanyData(
+                    symbol="TEST",
+                    name="Test Company",  # Use 'name' not 'company_name'
+                    sector="Technology",
+                    industry="Software",
+                    **fields,
+                )
+                score = scoring.score(test_company)
+                self.assertIsInstance(score, float)
+                self.assertGreaterEqual(score, 0.0)
+                self.assertLessEqual(score, 1.0)
 
 
 if __name__ == "__main__":
@@ -1,24 +1,69 @@
 """Edge case tests for the screener module."""
 
 import unittest
-from unittest.mock import Mock
 
+import numpy as np
 import pandas as pd
+from pydantic import TypeAdapter
 
+from dgi.models.company import CompanyData
 from dgi.screener import Screener
 
+# One adapter validates the whole record list in a single pydantic-core call.
+_COMPANY_LIST_ADAPTER = TypeAdapter(list[CompanyData])
+
+
+class _StubRepo:
+    """Minimal repository stand-in.
+
+    A plain class with one real method; Mock would record every attribute
+    access and call, which is wasted work for a fixed return value.
+    """
+
+    def __init__(self, rows: list[CompanyData]) -> None:
+        self._rows = rows
+
+    def get_rows(self) -> list[CompanyData]:
+        return self._rows
+
+
+# Read-only fixture frames built once at import; _create_mock_repo only
+# extracts records from them.
+NO_FILTER_DF = pd.DataFrame(
+    {
+        "symbol": ["AAPL", "MSFT"],
+        "dividend_yield": np.array([1.5, 2.0]),
+        "payout": np.array([25.0, 30.0]),
+        "dividend_cagr": np.array([5.0, 7.0]),
+    }
+)
+ALL_FILTERED_DF = pd.DataFrame(
+    {
+        "symbol": ["AAPL", "MSFT"],
+        "dividend_yield": np.array([0.5, 0.8]),  # Below threshold
+        "payout": np.array([90.0, 95.0]),  # Above threshold
+        "dividend_cagr": np.array([1.0, 2.0]),  # Below threshold
+    }
+)
+PARTIAL_FILTER_DF = pd.DataFrame(
+    {
+        "symbol": ["AAPL", "MSFT", "GOOGL"],
+        "dividend_yield": np.array([1.5, 2.5, 0.0]),
+        "payout": np.array([25.0, 30.0, 0.0]),
+        "dividend_cagr": np.array([5.0, 7.0, 0.0]),
+    }
+)
+
 
 class TestScreenerEdgeCases(unittest.TestCase):
     """Test edge cases for Screener class."""
 
-    def _create_mock_repo(self, test_data: pd.DataFrame) -> Mock:
-        """Helper to create mock repository with CompanyData objects."""
-        mock_repo = Mock()
-        from dgi.models.company import CompanyData
-
-        company_objects = []
-        for _, row in test_data.iterrows():
-            company_data = {
+    def _create_mock_repo(self, test_data: pd.DataFrame) -> _StubRepo:
+        """Helper to create a stub repository with CompanyData objects."""
+        # to_dict('records') extracts all cells in one pass; iterrows would
+        # allocate a boxed Series per row.
+        records = [
+            {
                 "symbol": row["symbol"],
                 "name": f"{row['symbol']} Corp",
                 "sector": "Technology",
@@ -28,32 +73,20 @@ class TestScreenerEdgeCases(unittest.TestCase):
                 "dividend_cagr": row["dividend_cagr"],
                 "fcf_yield": 3.0,
             }
-            company_objects.append(CompanyData(**company_data))
-        mock_repo.get_rows.return_value = company_objects
-        return mock_repo
+            for row in test_data.to_dict(orient="records")
+        ]
+        return _StubRepo(_COMPANY_LIST_ADAPTER.validate_python(records))
 
     def test_screener_empty_dataframe(self) -> None:
         """Test screener with empty DataFrame."""
-        mock_repo = Mock()
-        mock_repo.get_rows.return_value = []
-
-        screener = Screener(mock_repo)
+        screener = Screener(_StubRepo([]))
         result = screener.screen()
 
         self.assertTrue(result.empty)
 
     def test_screener_no_filters_applied(self) -> None:
         """Test screener with no filters."""
-        test_data = pd.DataFrame(
-            {
-                "symbol": ["AAPL", "MSFT"],
-                "dividend_yield": [1.5, 2.0],
-                "payout": [25.0, 30.0],
-                "dividend_cagr": [5.0, 7.0],
-            }
-        )
-
-        mock_repo = self._create_mock_repo(test_data)
+        mock_repo = self._create_mock_repo(NO_FILTER_DF)
 
         screener = Screener(mock_repo)
         result = screener.screen()
@@ -62,16 +95,7 @@ class TestScreenerEdgeCases(unittest.TestCase):
 
     def test_screener_all_filtered_out(self) -> None:
         """Test screener when all stocks are filtered out."""
-        test_data = pd.DataFrame(
-            {
-                "symbol": ["AAPL", "MSFT"],
-                "dividend_yield": [0.5, 0.8],  # Below threshold
-                "payout": [90.0, 95.0],  # Above threshold
-                "dividend_cagr": [1.0, 2.0],  # Below threshold
-            }
-        )
-
-        mock_repo = self._create_mock_repo(test_data)
+        mock_repo = self._create_mock_repo(ALL_FILTERED_DF)
 
         screener = Screener(mock_repo)
         result = screener.screen(min_yield=2.0, max_payout=60.0, min_cagr=5.0)
@@ -80,30 +104,18 @@ class TestScreenerEdgeCases(unittest.TestCase):
 
     def test_screener_partial_filtering(self) -> None:
         """Test screener with partial filtering."""
-        test_data = pd.DataFrame(
-            {
-                "symbol": ["AAPL", "MSFT", "GOOGL"],
-                "dividend_yield": [1.5, 2.5, 0.0],
-                "payout": [25.0, 30.0, 0.0],
-                "dividend_cagr": [5.0, 7.0, 0.0],
-            }
-        )
-
-        mock_repo = self._create_mock_repo(test_data)
+        mock_repo = self._create_mock_repo(PARTIAL_FILTER_DF)
 
         screener = Screener(mock_repo)
         result = screener.screen(min_yield=2.0, max_payout=60.0, min_cagr=5.0)
 
         self.assertEqual(len(result), 1)
-        self.assertEqual(result.iloc[0]["symbol"], "MSFT")
+        self.assertEqual(result["symbol"].iat[0], "MSFT")
 
     def test_screener_with_missing_columns(self) -> None:
         """Test screener with missing required columns."""
         # This test should fail during CompanyData creation due to missing fields
-        mock_repo = Mock()
-        mock_repo.get_rows.return_value = []  # Empty since data is invalid
-
-        screener = Screener(mock_repo)
+        screener = Screener(_StubRepo([]))  # Empty since data is invalid
 
         # This should handle missing columns gracefully by returning empty DataFrame
         result = screener.screen()